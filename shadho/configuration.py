@@ -72,10 +72,15 @@ class ShadhoConfig(object):
             'port': str(9123),
             'name': 'shadho_master',
             'shutdown': str(True),
-            'logfile': 'shadho_master.log',
+            'logfile': '',
             'debugfile': 'shadho_master.debug',
+            'debug_flags': 'wq',
+            'wait_timeout': str(10),
             'password': str(False)
         },
+        'local': {
+            'processes': str(1)
+        },
         'backend': {
             'type': 'sql',
             'url': 'sqlite:///:memory:'
@@ -132,6 +137,7 @@ class ShadhoConfig(object):
         # Instantiate config group objects
         self.shadho = ConfigGroup(self.config['global'])
         self.workqueue = ConfigGroup(self.config['workqueue'])
+        self.local = ConfigGroup(self.config['local'])
         self.backend = ConfigGroup(self.config['backend'])
 
     def __getattr__(self, attr):
@@ -6,8 +6,12 @@ set up SHADHO config and extra scripts. By default, these are installed to
 `$HOME/.shadhorc` and `$HOME/.shadho/`.
 """
 
+from shadho.configuration import ShadhoConfig
+
 import argparse
+import concurrent.futures
 import configparser
+import errno
 import os
 import pathlib
 import re
@@ -59,18 +63,25 @@ def install_workqueue(prefix):
 
         installer = os.path.join(os.path.dirname(__file__),
                                  'install_workqueue.sh')
-        subprocess.check_output(
-            ['sh', installer, tempdir, prefix],
-            stderr=subprocess.STDOUT)
-        result = 'not None'
-
-    except subprocess.CalledProcessError as e:
-        logfile = os.path.abspath('shadho_install.log')
-        print('Error installing Work Queue.')
-        print('Dumping install logs to {}'.format(logfile))
-        with open(logfile, 'w') as f:
-            f.write(e.output.decode())
-        result = None
+
+        # Stream the build output to a log file in the install directory as
+        # it is produced rather than holding all of it in memory. The log is
+        # kept only if the install fails.
+        logfile = os.path.join(os.path.abspath(prefix), 'shadho_install.log')
+        with open(logfile, 'wb', buffering=1 << 16) as f:
+            proc = subprocess.Popen(
+                ['sh', installer, tempdir, prefix],
+                stdout=f,
+                stderr=subprocess.STDOUT)
+            proc.wait()
+
+        if proc.returncode != 0:
+            print('Error installing Work Queue.')
+            print('Install logs written to {}'.format(logfile))
+            result = None
+        else:
+            os.remove(logfile)
+            result = 'not None'
     finally:
         shutil.rmtree(tempdir)
 
@@ -81,53 +92,13 @@ def write_shadhorc(shadho_dir):
 
     Parameters
     ----------
-    prefix : str
-        Path to install SHADHO config and Work Queue to.
     shadho_dir : str
         Path to the .shadho install directory.
     """
-    # Set up the default config values
-    default_config = {
-        'global': {
-            'wrapper': 'shadho_worker.py',
-            'utils': 'shadho_utils.py',
-            'output': 'out.tar.gz',
-            'result_file': 'performance.json',
-            'optimize': 'loss',
-            'param_file': 'hyperparameters.json',
-            'backend': 'json',
-            'manager': 'workqueue'
-        },
-        'workqueue': {
-            'port': '9123',
-            'name': 'shadho_master',
-            'shutdown': 'True',
-            'logfile': 'shadho_master.log',
-            'debugfile': 'shadho_master.debug',
-            'password': 'False'
-        },
-        'backend': {
-            'type': 'sql',
-            'url': 'sqlite:///:memory:'
-        }
-    }
-
-    default_config['global']['shadho_dir'] = str(shadho_dir)
-
-    # Load the default config into a ConfigParser. The try block is for
-    # Python3+, the except block is for Python 2.7.
-    try:
-        config = configparser.ConfigParser()
-        config.read_dict(default_config)
-    except AttributeError:
-        config = configparser.RawConfigParser()
-        for section in default_config:
-            config.add_section(str(section))
-            for entry in default_config[section]:
-                if type(default_config[section]) is dict:
-                    config.set(str(section),
-                               str(entry),
-                               str(default_config[section][entry]))
+    # Start from the SHADHO defaults, pointed at the install directory.
+    config = configparser.ConfigParser()
+    config.read_dict(ShadhoConfig.DEFAULTS)
+    config.set('global', 'shadho_dir', str(shadho_dir))
 
     # Write the .shadhorc.
     homedir = str(pathlib.Path().home())
@@ -135,6 +106,87 @@ def write_shadhorc(shadho_dir):
         config.write(f)
 
 
+def _fastcopy(src, dst):
+    """Copy a file, letting the kernel move the data where possible.
+
+    Parameters
+    ----------
+    src : str
+        Path to the file to copy.
+    dst : str
+        Path to the destination file or directory.
+
+    Returns
+    -------
+    dst : str
+        Path to the copied file.
+
+    Notes
+    -----
+    Data is copied with ``os.copy_file_range`` where available, falling
+    back to ``os.sendfile`` and finally to a buffered read/write loop. Like
+    `shutil.copy`, the permission bits of ``src`` are copied to ``dst``.
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+
+    fallback_errors = (errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+                       errno.EOPNOTSUPP, errno.ENOTSUP)
+
+    infd = os.open(src, os.O_RDONLY)
+    try:
+        size = os.fstat(infd).st_size
+        outfd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            copied = 0
+
+            # Kernel-side copy, zero-copy on filesystems that support it.
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    while copied < size:
+                        n = os.copy_file_range(infd, outfd, size - copied)
+                        if n == 0:
+                            break
+                        copied += n
+                except OSError as e:
+                    if e.errno not in fallback_errors:
+                        raise
+
+            # Kernel-side copy through the page cache.
+            if copied < size and hasattr(os, 'sendfile'):
+                try:
+                    while copied < size:
+                        n = os.sendfile(outfd, infd, copied, size - copied)
+                        if n == 0:
+                            break
+                        copied += n
+                except OSError as e:
+                    if e.errno not in fallback_errors:
+                        raise
+
+            # Userspace copy with a single reusable 1 MiB buffer.
+            if copied < size:
+                os.lseek(infd, copied, os.SEEK_SET)
+                os.lseek(outfd, copied, os.SEEK_SET)
+                buf = bytearray(1 << 20)
+                view = memoryview(buf)
+                with open(infd, 'rb', buffering=0, closefd=False) as f:
+                    n = f.readinto(buf)
+                    while n:
+                        # os.write may write fewer bytes than requested.
+                        written = 0
+                        while written < n:
+                            written += os.write(outfd, view[written:n])
+                        n = f.readinto(buf)
+        finally:
+            os.close(outfd)
+    finally:
+        os.close(infd)
+
+    shutil.copymode(src, dst)
+    return dst
+
+
 def install_shadho_files(prefix, sp_prefix):
     """Setup up additional SHADHO files.
 
@@ -148,8 +200,14 @@ def install_shadho_files(prefix, sp_prefix):
     maj = sys.version_info.major
     min = sys.version_info.minor
     source = os.path.join(prefix, 'lib', f'python{maj}.{min}', 'site-packages')
-    shutil.copy(os.path.join(source, 'work_queue.py'), sp_prefix)
-    shutil.copy(os.path.join(source, '_work_queue.so'), sp_prefix)
+
+    # The copies are independent and I/O-bound, so run them concurrently.
+    sources = [os.path.join(source, 'work_queue.py'),
+               os.path.join(source, '_work_queue.so')]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(_fastcopy, src, sp_prefix) for src in sources]
+        for future in futures:
+            future.result()
 
 
 def main(prefix='~', user=False):
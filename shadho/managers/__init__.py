@@ -1,3 +1,15 @@
 from .manager_factory import create_manager
 
-__all__ = ['WQManager', 'WQFile', 'WQBuffer']
+_WORKQUEUE_CLASSES = ('WQManager', 'WQFile', 'WQBuffer')
+
+__all__ = ['create_manager', *_WORKQUEUE_CLASSES]
+
+
+def __getattr__(name):
+    # Import the Work Queue classes on first access so that local-only runs
+    # never load the Work Queue bindings.
+    if name in _WORKQUEUE_CLASSES:
+        from . import workqueue
+        return getattr(workqueue, name)
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name))
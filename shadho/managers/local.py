@@ -1,4 +1,4 @@
-"""Task management for local, serial hyperparameter optimization.
+"""Task management for local hyperparameter optimization.
 
 Classes
 -------
@@ -8,11 +8,15 @@ LocalTask
     Wrapper for running a task locally.
 """
 from collections import deque
+import itertools
 import json
+import multiprocessing as mp
 import time
-import uuid
+import traceback
 
-from shadho.managers.workqueue import WQBuffer
+
+# Source of process-local task ids.
+_task_ids = itertools.count()
 
 
 class TaskFailureError(Exception):
@@ -28,6 +32,9 @@ class LocalManager(object):
     ----------
     opt_value : str
         The value to search for in a task result.
+    processes : int, optional
+        The number of worker processes used by `run_batch` and `run_all`. If
+        1 (default), tasks are run serially in this process.
 
     Attributes
     ----------
@@ -35,11 +42,32 @@ class LocalManager(object):
         The tasks to run locally.
     opt_value : str
         The value to search for in a task result.
+    processes : int
+        The number of worker processes used by `run_batch` and `run_all`.
+
+    Notes
+    -----
+    To run tasks in worker processes, the objective function and its
+    hyperparameters must be picklable, e.g. a module-level function.
     """
-    def __init__(self, opt_value):
+    __slots__ = ('tasks', 'opt_value', 'tasks_submitted', 'processes', '_pool')
+
+    def __init__(self, opt_value, processes=1):
         self.tasks = deque()
         self.opt_value = opt_value
         self.tasks_submitted = 0
+        self.processes = processes
+        self._pool = None
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Shut down the worker process pool, if one was started."""
+        if getattr(self, '_pool', None) is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
 
     def empty(self):
         """Determine if the task queue is empty.
@@ -76,7 +104,27 @@ class LocalManager(object):
         # Enqueue the new task
         self.tasks.append(task)
         self.tasks_submitted += 1
-    
+
+    def add_tasks(self, cmd, tasks, files=None, resource=None, value=None):
+        """Add several tasks that share an objective function.
+
+        Parameters
+        ----------
+        cmd : callable
+            The objective function.
+        tasks : iterable of (str, dict)
+            The tag and hyperparameter values of each task.
+        files : optional
+            Placeholder to match other managers.
+        resource : optional
+            Placeholder to match other managers.
+        value : optional
+            Placeholder to match other managers.
+        """
+        n = len(self.tasks)
+        self.tasks.extend(LocalTask(cmd, tag, params) for tag, params in tasks)
+        self.tasks_submitted += len(self.tasks) - n
+
     def hungry(self, pending_tasks=0, leeway=0):
         """Indicates whether the manager can receive more tasks.
 
@@ -101,7 +149,7 @@ class LocalManager(object):
         return True
     
     def num_workers(self):
-        return 1
+        return self.processes if self.processes and self.processes > 1 else 1
 
     def run_task(self):
         """Run the next task on the task list and return its result.
@@ -119,6 +167,9 @@ class LocalManager(object):
             Only returned on success. The value being optimized.
         results : dict
             Only returned on success. Other results returned by the task.
+        resubmit : bool
+            Only returned on failure. Always False, as local tasks are not
+            lost to worker dropout.
         """
         # Attempt to get the next task
         try:
@@ -128,57 +179,200 @@ class LocalManager(object):
 
         # If there is a task, try to run it
         if task is not None:
-            result = None
-
-            # Set up the task tag for return
-            ret = [task.tag]
-
-            # Try to run the task, and attempt to catch and report any errors
-            try:
-                result = task.run()
-
-                # Package the result to return
-                if result is not None:
-                    # Handle the case of multiple values and single value being returned
-                    if not isinstance(result, list):
-                        if isinstance(result, dict):
-                            ret.append(result[self.opt_value])
-                            ret.append(result)
-                        elif isinstance(result, float):
-                            ret.append(result)
-                            ret.append({self.opt_value: result})
-                        else:
-                            raise ValueError
-                    else:
-                        optima = []
-                        results = []
-
-                        for r in result:
-                            if isinstance(r, dict):
-                                optima.append(r[self.opt_value])
-                                results.append(r)
-                            elif isinstance(r, float):
-                                optima.append(r)
-                                results.append({self.opt_value: r})
-                            else:
-                                raise ValueError
-
-                        ret.append(optima)
-                        ret.append(results)
-            except TaskFailureError as e:
-                print("Error: Task failed due to the following error:")
-                print(str(e))
-            except ValueError:
-                print("Error: Invalid task result {}".format(result))
-                print("Task results must be of type float")
-                print("or dict with a float in key {}".format(self.opt_value))
-            except KeyError:
-                print("Error: Result {} does not contain the value {} to optimize."
-                      .format(result, self.opt_value))
-                print("Please check your function to ensure that it returns the")
-                print("correct value.")
-
-            return tuple(ret) if result is not None else None
+            return self._run(task)
+
+    def run_batch(self, n):
+        """Run up to ``n`` tasks from the task list and return their results.
+
+        If ``processes`` is greater than 1, the tasks are distributed over a
+        persistent pool of worker processes and results are returned in
+        order of completion. Otherwise, a single task is run in this process
+        so that the caller regains control, e.g. to check a deadline, after
+        every task.
+
+        Parameters
+        ----------
+        n : int
+            The maximum number of tasks to run.
+
+        Returns
+        -------
+        results : list of tuple
+            The result of each task run, in the format returned by
+            `run_task`.
+        """
+        if self.processes is not None and self.processes > 1:
+            return self._run_parallel(n)
+        return self._run_serial(min(n, 1))
+
+    def run_all(self):
+        """Run every task on the task list and return their results.
+
+        Returns
+        -------
+        results : list of tuple
+            The result of each task run, in the format returned by
+            `run_task`.
+
+        See Also
+        --------
+        `shadho.managers.local.LocalManager.run_batch`
+        """
+        if self.processes is not None and self.processes > 1:
+            return self._run_parallel(len(self.tasks))
+        return self._run_serial(len(self.tasks))
+
+    def _run(self, task):
+        """Run a task, reporting any errors, and package its result."""
+        return self._finish(*_run_one(task)[1:])
+
+    def _run_serial(self, n):
+        """Run up to ``n`` tasks in this process."""
+        popleft = self.tasks.popleft
+        run = self._run
+        return [run(popleft()) for _ in range(min(n, len(self.tasks)))]
+
+    def _run_parallel(self, n):
+        """Run up to ``n`` tasks in the worker process pool.
+
+        Tasks stay on the task list until their results come back, so tasks
+        are not lost if the pool cannot accept them (e.g. an objective that
+        cannot be pickled).
+        """
+        if self._pool is None:
+            self._pool = mp.Pool(self.processes)
+
+        tasks = list(itertools.islice(self.tasks, n))
+        chunksize = max(1, len(tasks) // (4 * self.processes))
+
+        finished = set()
+        results = []
+        try:
+            for task_id, tag, result, error in self._pool.imap_unordered(
+                    _run_one, tasks, chunksize=chunksize):
+                finished.add(task_id)
+                results.append(self._finish(tag, result, error))
+        finally:
+            self.tasks = deque(t for t in self.tasks if t.id not in finished)
+        return results
+
+    def _finish(self, tag, result, error=None):
+        """Report any errors from a task run and package its result."""
+        # Report the failure if running the task raised an error
+        if error is not None:
+            print("Error: Task failed due to the following error:")
+            print(error)
+            return (tag, False)
+
+        # Package the result to return, and attempt to catch and report any
+        # errors
+        try:
+            if result is not None:
+                return (tag, *_package(result, self.opt_value))
+        except ValueError:
+            print("Error: Invalid task result {}".format(result))
+            print("Task results must be of type float")
+            print("or dict with a float in key {}".format(self.opt_value))
+        except KeyError:
+            print("Error: Result {} does not contain the value {} to optimize."
+                  .format(result, self.opt_value))
+            print("Please check your function to ensure that it returns the")
+            print("correct value.")
+
+        return (tag, False)
+
+
+def _run_one(task):
+    """Run a task, capturing any task failure.
+
+    This is a module-level function so that it can be sent to worker
+    processes.
+
+    Parameters
+    ----------
+    task : LocalTask
+        The task to run.
+
+    Returns
+    -------
+    id : int
+        The task id.
+    tag : str
+        The task tag.
+    result
+        The value returned by the task, or None if it failed.
+    error : str or None
+        The formatted traceback if the task failed, otherwise None.
+    """
+    try:
+        return task.id, task.tag, task.run(), None
+    except Exception:
+        return task.id, task.tag, None, traceback.format_exc()
+
+
+def _package(result, opt_value):
+    """Split a task result into the loss and the full result.
+
+    Parameters
+    ----------
+    result : float or dict or list
+        The value returned by the objective function.
+    opt_value : str
+        The value to search for in a dictionary result.
+
+    Returns
+    -------
+    loss : float or list of float
+        The value being optimized.
+    results : dict or list of dict
+        The full result(s), with non-dictionary results wrapped as
+        ``{opt_value: result}``.
+
+    Raises
+    ------
+    ValueError
+        Raised when a result is not a float or a dict.
+    KeyError
+        Raised when a dict result does not contain ``opt_value``.
+    """
+    return _handler(result, _PACKERS)(result, opt_value)
+
+
+def _pack_dict(result, opt_value):
+    return result[opt_value], result
+
+
+def _pack_float(result, opt_value):
+    return result, {opt_value: result}
+
+
+def _pack_list(result, opt_value):
+    optima = []
+    results = []
+
+    for r in result:
+        loss, r = _handler(r, _SINGLE_PACKERS)(r, opt_value)
+        optima.append(loss)
+        results.append(r)
+
+    return optima, results
+
+
+# Result packaging dispatch by exact type. Subclasses (e.g. numpy.float64 or
+# OrderedDict) fall back to an isinstance check in `_handler`.
+_SINGLE_PACKERS = {dict: _pack_dict, float: _pack_float}
+_PACKERS = {dict: _pack_dict, float: _pack_float, list: _pack_list}
+
+
+def _handler(result, packers):
+    """Look up the packing function for a result."""
+    try:
+        return packers[type(result)]
+    except KeyError:
+        for t, handler in packers.items():
+            if isinstance(result, t):
+                return handler
+        raise ValueError
 
 
 class LocalTask(object):
@@ -195,8 +389,8 @@ class LocalTask(object):
 
     Attributes
     ----------
-    id : str
-        Internal task id.
+    id : int
+        Internal task id, unique within this process.
     cmd : function or callable object
         The command to run.
     tag : str
@@ -204,8 +398,10 @@ class LocalTask(object):
     params : dict
         The parameters to supply to the task.
     """
+    __slots__ = ('id', 'cmd', 'tag', 'params')
+
     def __init__(self, cmd, tag, params):
-        self.id = str(uuid.uuid4())
+        self.id = next(_task_ids)
         self.cmd = cmd
         self.tag = tag
         self.params = params
@@ -1,5 +1,31 @@
+"""Factory for SHADHO task managers.
+
+Functions
+---------
+create_manager
+    Create the task manager requested by the SHADHO configuration.
+"""
+
+
 def create_manager(manager_type='local', config=None, tmpdir=None):
-    print(config.config)
+    """Create a task manager.
+
+    Parameters
+    ----------
+    manager_type : {'local', 'workqueue'}
+        The type of manager to create. Any value other than 'workqueue'
+        creates a `shadho.managers.local.LocalManager`.
+    config : `shadho.configuration.ShadhoConfig`
+        The SHADHO configuration to set the manager up with.
+    tmpdir : str, optional
+        Temporary directory used by SHADHO for task output. Only used by the
+        Work Queue manager.
+
+    Returns
+    -------
+    manager : `shadho.managers.workqueue.WQManager` or `shadho.managers.local.LocalManager`
+        The new task manager.
+    """
     if manager_type == 'workqueue':
         from .workqueue import WQManager
         return WQManager(
@@ -12,8 +38,11 @@ def create_manager(manager_type='local', config=None, tmpdir=None):
             port=config.workqueue.port,
             shutdown=config.workqueue.shutdown,
             logfile=config.workqueue.logfile,
-            debugfile=config.workqueue.debugfile
+            debugfile=config.workqueue.debugfile,
+            debug_flags=config.workqueue.debug_flags,
+            wait_timeout=config.workqueue.wait_timeout
         )
     else:
         from .local import LocalManager
-        return LocalManager(config.optimize)
+        return LocalManager(config.optimize,
+                            processes=int(config.local.processes))
@@ -8,9 +8,10 @@ WQFile
 WQBuffer
     Work-Queue-conformant representations of files and buffers for task I/O.
 """
-import json
+from concurrent.futures import ThreadPoolExecutor
 import os
 import tarfile
+import traceback
 
 try:
     import work_queue as WORKQUEUE
@@ -23,7 +24,14 @@ except ImportError:
     except OSError:
         raise
 
-from shadho.utils import ShadhoEncoder, ShadhoDecoder
+from shadho.utils import dumps, loads
+
+
+# Work Queue file flags, bound once for use when building tasks.
+_INPUT = WORKQUEUE.WORK_QUEUE_INPUT
+_OUTPUT = WORKQUEUE.WORK_QUEUE_OUTPUT
+_CACHE = WORKQUEUE.WORK_QUEUE_CACHE
+_NOCACHE = WORKQUEUE.WORK_QUEUE_NOCACHE
 
 
 class WQManager(WORKQUEUE.WorkQueue):
@@ -34,7 +42,9 @@ class WQManager(WORKQUEUE.WorkQueue):
     param_file : str
         The name of the hyperparameter value file sent to the worker.
     out_file : str
-        The name of the expected output file returned from the worker.
+        The name of the expected output file returned from the worker. If
+        this is the same as `results_file`, the results file is returned
+        directly instead of in a tarball.
     results_file : str
         The name of the expected results file returned from the worker.
     opt_value : str
@@ -52,9 +62,23 @@ class WQManager(WORKQUEUE.WorkQueue):
         Whether to shut down connected workers when this manager shuts down.
         True by default.
     logfile : str, optional
-        Where to write Work Queue logs. ./wq_shadho.log by default.
+        Where to write Work Queue logs, e.g. ./shadho_wq.log. Work Queue
+        writes to this log on every task event, so no log is written by
+        default.
     debugfile : str, optional
             Where to write Work Queue debug logs. ./wq_shadho.debug by default.
+    debug_flags : str, optional
+        The cctools debug flags to enable, 'wq' by default. Pass 'all' only
+        when troubleshooting, as it logs every event of every subsystem. If
+        None or empty, no debug log is written.
+    debugfile_size : int, optional
+        Size in bytes at which the debug log is rotated, 100 MiB by default.
+        Pass 0 to never rotate.
+    wait_timeout : int, optional
+        The number of seconds to wait for a task to return before giving
+        control back to the search loop. 10 by default. Longer timeouts cause
+        fewer idle wake-ups when tasks are long-running, but delay the search
+        timeout and the submission of tasks to newly connected workers.
 
     Attributes
     ----------
@@ -63,10 +87,13 @@ class WQManager(WORKQUEUE.WorkQueue):
 
     def __init__(self, param_file, out_file, results_file, opt_value, tmpdir,
                  name='shadho', port=9123, shutdown=True,
-                 logfile='shadho_wq.log', debugfile='shadho_wq.debug'):
-        WORKQUEUE.cctools_debug_flags_set("all")
-        WORKQUEUE.cctools_debug_config_file(debugfile)
-        WORKQUEUE.cctools_debug_config_file_size(0)
+                 logfile=None, debugfile='shadho_wq.debug',
+                 debug_flags='wq', debugfile_size=100 << 20,
+                 wait_timeout=10):
+        if debug_flags:
+            WORKQUEUE.cctools_debug_flags_set(debug_flags)
+            WORKQUEUE.cctools_debug_config_file(debugfile)
+            WORKQUEUE.cctools_debug_config_file_size(debugfile_size)
 
         if os.environ['USER'] not in name:
             name += '-{}'.format(os.environ['USER'])
@@ -75,15 +102,30 @@ class WQManager(WORKQUEUE.WorkQueue):
                                         port=int(port),
                                         shutdown=shutdown)
 
-        self.specify_log(logfile)
+        if logfile:
+            self.specify_log(logfile)
 
         self.param_file = param_file
         self.out_file = out_file
         self.results_file = results_file
         self.opt_value = opt_value
         self.tmpdir = tmpdir
+        self.wait_timeout = int(wait_timeout)
         self.tasks_submitted = self.stats.tasks_submitted
 
+        # Threads for reading and parsing returned task results, created on
+        # first use and shut down by `close`.
+        self._pool = None
+
+        # Local output file path of each submitted task, keyed by tag. Paths
+        # are built as <tmpdir>/<tag>.<out_file>.
+        self._outfiles = {}
+        self._out_prefix = os.path.join(tmpdir, '')
+        self._out_suffix = '.' + out_file
+
+        # WQFile objects built from file tuples, reused across tasks.
+        self._files = {}
+
     def add_task(self, cmd, tag, params, files=None, resource=None, value=None):
         """Create a task for this manager.
 
@@ -109,48 +151,90 @@ class WQManager(WORKQUEUE.WorkQueue):
         `shadho.managers.workqueue.WQBuffer`
         `work_queue.Task`
         """
-        # Set up the task to run the specified command with its tag as the
-        # trailing argument.
-        task = WORKQUEUE.Task(' '.join([cmd, tag]))
-        task.specify_tag(tag)
+        self.add_tasks(cmd, [(tag, params)], files=files, resource=resource,
+                       value=value)
 
-        # Set up the input and output file structure of the task. This
-        # structure is preserved on the worker.
-        if files is None:
-            files = []
+    def add_tasks(self, cmd, tasks, files=None, resource=None, value=None):
+        """Create several tasks that share a command, files, and resources.
 
-        for f in files:
-            if isinstance(f, tuple):
-                f = WQFile(f[0], remotepath=f[1], ftype=f[2], cache=f[3])
-            f.add_to_task(task)
-
-        # Set up the output file
-        out = WQFile(os.path.join(self.tmpdir,
-                                  '.'.join([tag, self.out_file])),
-                     remotepath=self.out_file,
-                     ftype='output',
-                     cache=False)
-
-        # Send the hyperparameters as a JSON string
-        buff = WQBuffer(str(json.dumps(params, cls=ShadhoEncoder)),
-                        self.param_file,
-                        cache=False)
-
-        out.add_to_task(task)
-        buff.add_to_task(task)
-
-        # Add information about the expected hardware resource
-        if resource is not None:
-            if resource == 'cores':
-                task.specify_cores(value)
-            elif resource == 'feature':
-                task.specify_requirement(value)
-            else:
-                task.specify_resource(resource, value)
+        Parameters
+        ----------
+        cmd : str
+            The command to run on the remote worker, e.g. ``echo hello`` or
+            ``python script.py``.
+        tasks : iterable of (str, dict)
+            The tag and hyperparameter values of each task.
+        files : list of `WQFile` or `WQBuffer`, optional
+            The input and output files and data buffers that every task will
+            send/receive.
+        resource : str, optional
+            The hardware resource to request for every task.
+        value : optional
+            The value of ``resource`` to request.
 
-        # Submit the task
-        self.submit(task)
-        self.tasks_submitted = self.stats.tasks_submitted
+        See Also
+        --------
+        `shadho.managers.workqueue.WQManager.add_task`
+        """
+        # Set up the input and output file structure shared by the tasks.
+        # This structure is preserved on the worker.
+        shared = []
+        for f in files if files is not None else []:
+            if isinstance(f, tuple):
+                try:
+                    f = self._files[f]
+                except KeyError:
+                    wqfile = WQFile(f[0], remotepath=f[1], ftype=f[2],
+                                    cache=f[3])
+                    self._files[f] = wqfile
+                    f = wqfile
+            shared.append(f)
+
+        Task = WORKQUEUE.Task
+        submit = self.submit
+        outfiles = self._outfiles
+        prefix = self._out_prefix
+        suffix = self._out_suffix
+        out_file = self.out_file
+        param_file = self.param_file
+
+        submitted = 0
+        for tag, params in tasks:
+            # Set up the task to run the specified command with its tag as the
+            # trailing argument.
+            task = Task(f'{cmd} {tag}')
+            task.specify_tag(tag)
+
+            for f in shared:
+                f.add_to_task(task)
+
+            # Set up the output file. The per-task output file and
+            # hyperparameter buffer are specified directly rather than
+            # through short-lived WQFile/WQBuffer wrappers.
+            outfile = f'{prefix}{tag}{suffix}'
+            outfiles[tag] = outfile
+            task.specify_file(outfile, remote_name=out_file, type=_OUTPUT,
+                              cache=_NOCACHE)
+
+            # Send the hyperparameters as a JSON string
+            task.specify_buffer(dumps(params), param_file, _NOCACHE)
+
+            # Add information about the expected hardware resource
+            if resource is not None:
+                if resource == 'cores':
+                    task.specify_cores(value)
+                elif resource == 'feature':
+                    task.specify_requirement(value)
+                else:
+                    task.specify_resource(resource, value)
+
+            # Submit the task
+            submit(task)
+            submitted += 1
+
+        # Count submissions locally rather than reading them back from
+        # Work Queue, which builds a new stats struct on every access.
+        self.tasks_submitted += submitted
 
     def hungry(self, pending_tasks=0, leeway=0):
         """Indicates whether the manager can receive more tasks.
@@ -200,18 +284,91 @@ class WQManager(WORKQUEUE.WorkQueue):
             Additional results returned by the objective function.
             Only returned on success.
         """
-        # Wait for a task to return for 10s
-        task = self.wait(timeout=10)
+        # Wait for a task to return
+        task = self.wait(timeout=self.wait_timeout)
 
         # Handle task success or failure (no return if `task` is None)
         if task is not None:
-            if self.task_succeeded(task):
-                return self.success(task)
-            else:
-                return self.failure(task)
+            return self.handle_task(task)
         else:
             return None
 
+    def run_batch(self, n, timeout=None):
+        """Await the return of running tasks and collect all that are ready.
+
+        Waits up to ``timeout`` seconds for the first task, then collects any
+        other tasks that have already returned without waiting further. The
+        result files of multiple successful tasks are read and parsed in
+        parallel; everything else is done on the calling thread, and a task
+        whose result cannot be processed is handled as a failure.
+
+        Parameters
+        ----------
+        n : int
+            The maximum number of tasks to collect.
+        timeout : int, optional
+            The number of seconds to wait for the first task. Defaults to
+            `wait_timeout`.
+
+        Returns
+        -------
+        results : list of tuple
+            The results of the returned tasks, in the format returned by
+            `success` or `failure`.
+        """
+        tasks = []
+        task = self.wait(timeout=timeout if timeout is not None
+                         else self.wait_timeout)
+        while task is not None:
+            tasks.append(task)
+            if len(tasks) >= n:
+                break
+            task = self.wait(timeout=0)
+
+        loaders = {}
+        if len(tasks) > 1:
+            pool = self._get_pool()
+            for task in tasks:
+                if self.task_succeeded(task):
+                    loaders[task.tag] = pool.submit(self._load_result, task)
+
+        results = []
+        for task in tasks:
+            try:
+                if task.tag in loaders:
+                    results.append(self.success(task, loaders[task.tag]))
+                else:
+                    results.append(self.handle_task(task))
+            except Exception:
+                print('Error processing task {}'.format(task.tag))
+                traceback.print_exc()
+                results.append(self.failure(task))
+        return results
+
+    def close(self):
+        """Shut down the threads used to process returned tasks."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def handle_task(self, task):
+        """Process a returned task as a success or failure.
+
+        Parameters
+        ----------
+        task : work_queue.Task
+            The returned task.
+
+        Returns
+        -------
+        result : tuple
+            The output of `success` or `failure`.
+        """
+        if self.task_succeeded(task):
+            return self.success(task)
+        else:
+            return self.failure(task)
+
     def task_succeeded(self, task):
         """Determine whether or not a task succeeded.
 
@@ -232,13 +389,16 @@ class WQManager(WORKQUEUE.WorkQueue):
         return task is not None and \
             task.result == WORKQUEUE.WORK_QUEUE_RESULT_SUCCESS
 
-    def success(self, task):
+    def success(self, task, loader=None):
         """Handle Work Queue task success.
 
         Parameters
         ----------
         task : work_queue.Task
             The successful task with results to process.
+        loader : concurrent.futures.Future, optional
+            A pending call to `_load_result` for this task. If not supplied,
+            the result is loaded on the calling thread.
 
         Returns
         -------
@@ -252,15 +412,15 @@ class WQManager(WORKQUEUE.WorkQueue):
             Other results returned by the task.
         """
         try:
-            # Open the result tarfile and get the results file.
-            outfile = '.'.join([task.tag, self.out_file])
-            result = tarfile.open(os.path.join(self.tmpdir, outfile), 'r')
-            resultstr = result.extractfile(self.results_file).read()
-            result.close()
-        except IOError:
-            print("Error opening task {} result".format(rid))
-
-        result = json.loads(resultstr.decode('utf-8'), cls=ShadhoDecoder)
+            if loader is None:
+                result = self._load_result(task)
+            else:
+                result = loader.result()
+        except (IOError, KeyError, ValueError, tarfile.TarError):
+            print("Error opening task {} result".format(task.tag))
+            return self.failure(task)
+        self._discard_output(task.tag)
+
         if isinstance(result, list):
             loss = []
             for r in result:
@@ -275,6 +435,30 @@ class WQManager(WORKQUEUE.WorkQueue):
             result['finish_time'] = task.finish_time
         return (task.tag, loss, result)
 
+    def _load_result(self, task):
+        """Read and parse the results file of a successful task.
+
+        This only reads state, so it may be run on the manager's threads.
+
+        Parameters
+        ----------
+        task : work_queue.Task
+            The successful task.
+
+        Returns
+        -------
+        result : dict or list
+            The decoded results.
+        """
+        # Read the results file, either returned directly by the worker or
+        # packed in the result tarfile.
+        outfile = self._outfiles[task.tag]
+        if self.out_file == self.results_file:
+            resultstr = _read_file(outfile)
+        else:
+            resultstr = _read_tar_member(outfile, self.results_file)
+        return loads(resultstr)
+
     def failure(self, task):
         """Handle Work Queue task failure.
 
@@ -293,12 +477,117 @@ class WQManager(WORKQUEUE.WorkQueue):
         print('Task {} failed with result {} and WQ status {}'
               .format(task.tag, task.result, task.return_status))
         print(task.output)
+        # Failed tasks may be resubmitted under the same tag and output path,
+        # so remove the old output before returning.
+        self._discard_output(task.tag, background=False)
 
         resub = (int(task.return_status) == 137)
 
         #rid, ccid = str(task.tag).split('.')
         return (task.tag, resub)
 
+    def _discard_output(self, tag, background=True):
+        """Forget a task's output file and delete it.
+
+        Parameters
+        ----------
+        tag : str
+            The task tag.
+        background : bool, optional
+            If True (default), delete the file on the manager's thread pool.
+            Otherwise, delete it before returning.
+        """
+        outfile = self._outfiles.pop(tag, None)
+        if outfile is not None:
+            if background:
+                self._get_pool().submit(_remove, outfile)
+            else:
+                _remove(outfile)
+
+    def _get_pool(self):
+        """Get the manager's thread pool, starting it if necessary."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor()
+        return self._pool
+
+
+def _remove(path):
+    """Delete a file, ignoring errors if it cannot be removed."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _read_file(path):
+    """Read the contents of a file with as few system calls as possible.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file.
+
+    Returns
+    -------
+    contents : bytes
+        The contents of the file.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = [os.read(fd, max(os.fstat(fd).st_size, 1))]
+        while chunks[-1]:
+            chunks.append(os.read(fd, 1 << 20))
+    finally:
+        os.close(fd)
+    return b''.join(chunks)
+
+
+def _read_tar_member(path, name):
+    """Read the contents of a file stored in a tar archive.
+
+    Parameters
+    ----------
+    path : str
+        Path to the tar archive.
+    name : str
+        The name of the archive member to read.
+
+    Returns
+    -------
+    contents : bytes
+        The contents of the archive member.
+
+    Raises
+    ------
+    KeyError
+        Raised when ``name`` is not in the archive.
+
+    Notes
+    -----
+    Task output archives normally hold only the results file, so the first
+    header is parsed directly and the member is read without building the
+    archive index. Anything else (compressed archives, extended headers,
+    other members) is read by streaming through the archive with `tarfile`.
+    """
+    with open(path, 'rb') as f:
+        header = f.read(tarfile.BLOCKSIZE)
+        if len(header) == tarfile.BLOCKSIZE \
+                and header[257:262] == b'ustar' \
+                and header[156:157] in (tarfile.REGTYPE, tarfile.AREGTYPE) \
+                and not header[124] & 0x80 \
+                and not header[345:500].strip(b'\0') \
+                and header[:100].rstrip(b'\0') == name.encode('utf-8'):
+            size = int(header[124:136].strip(b'\0 ') or b'0', 8)
+            contents = f.read(size)
+            if len(contents) == size:
+                return contents
+
+    with tarfile.open(path, 'r|*', bufsize=1 << 20) as tar:
+        for member in tar:
+            if member.name == name:
+                return tar.extractfile(member).read()
+    raise KeyError("filename {!r} not found".format(name))
+
 
 class WQFile(object):
     """File to send to or receive from a remote worker.
@@ -315,6 +604,9 @@ class WQFile(object):
         worker.
     cache : bool, optional
         Whether to cache this file on the remote worker.
+    check_exists : bool, optional
+        Whether to check that an input file exists. Each path is only checked
+        the first time it is seen. True by default.
 
     Attributes
     ----------
@@ -329,6 +621,7 @@ class WQFile(object):
         Whether to cache this file on the remote worker.
 
     """
+    __slots__ = ('localpath', 'remotepath', 'ftype', 'cache')
 
     TYPES = {
         'input': WORKQUEUE.WORK_QUEUE_INPUT,
@@ -340,17 +633,36 @@ class WQFile(object):
         False: WORKQUEUE.WORK_QUEUE_NOCACHE
     }
 
-    def __init__(self, localpath, remotepath=None, ftype='input', cache=True):
-        if ftype != 'output' and not os.path.isfile(localpath):
-            raise IOError("{} does not exist.".format(localpath))
-        else:
-            self.localpath = localpath
+    # Input file paths that have already been found to exist.
+    _exists_cache = set()
+
+    def __init__(self, localpath, remotepath=None, ftype='input', cache=True,
+                 check_exists=True):
+        if check_exists and ftype != 'output' \
+                and localpath not in WQFile._exists_cache:
+            if not os.path.isfile(localpath):
+                raise IOError("{} does not exist.".format(localpath))
+            WQFile._exists_cache.add(localpath)
+        self.localpath = localpath
 
         self.remotepath = remotepath if remotepath is not None \
                           else os.path.basename(localpath)
 
-        self.ftype = WQFile.TYPES[ftype]
-        self.cache = WQFile.CACHE[cache]
+        # Compare against the common values directly and fall back to the
+        # lookup tables, which raise KeyError for invalid values.
+        if ftype == 'input':
+            self.ftype = _INPUT
+        elif ftype == 'output':
+            self.ftype = _OUTPUT
+        else:
+            self.ftype = WQFile.TYPES[ftype]
+
+        if cache is True:
+            self.cache = _CACHE
+        elif cache is False:
+            self.cache = _NOCACHE
+        else:
+            self.cache = WQFile.CACHE[cache]
 
     def add_to_task(self, task):
         """Add the file to a task.
@@ -378,8 +690,9 @@ class WQBuffer(object):
 
     Parameters
     ----------
-    buffer : str
-        The string buffer to send to the remote task.
+    buffer : str or bytes
+        The string buffer to send to the remote task. The Work Queue binding
+        only accepts str, so bytes are decoded as UTF-8.
     remotepath : str, optional
         Where to place the file on the remote worker relative to cwd. Set to
         the basename of `localpath` by default (e.g. foo/bar.baz -> bar.baz).
@@ -401,11 +714,23 @@ class WQBuffer(object):
     and as such are always treated as non-caching input files.
 
     """
+    __slots__ = ('buffer', 'remotepath', 'cache', 'ftype')
 
     def __init__(self, buffer, remotepath, cache=False):
-        self.buffer = str(buffer)
-        self.remotepath = str(remotepath)
-        self.cache = WQFile.CACHE[cache]
+        if isinstance(buffer, str):
+            self.buffer = buffer
+        elif isinstance(buffer, bytes):
+            self.buffer = buffer.decode('utf-8')
+        else:
+            self.buffer = str(buffer)
+        self.remotepath = remotepath if isinstance(remotepath, str) \
+            else str(remotepath)
+        if cache is False:
+            self.cache = _NOCACHE
+        elif cache is True:
+            self.cache = _CACHE
+        else:
+            self.cache = WQFile.CACHE[cache]
         self.ftype = 'buffer'
 
     def add_to_task(self, task):
@@ -3,6 +3,7 @@
 Functions
 ---------
 scale_value
+scale_many
 linear
 ln
 log_10
@@ -15,12 +16,18 @@ The user will expect to see an integer when an integer is input, a float when
 a float is input, or a string when a string is input. The only function where
 integer preservation is not possible is `ln`.
 """
+import math
 import numbers
 import warnings
 
 import numpy as np
 
 
+# Concrete numeric types, checked before the slower `numbers.Number` ABC.
+_NUMERIC = (int, float, np.integer, np.floating)
+_NUMERIC_OR_ARRAY = _NUMERIC + (np.ndarray,)
+
+
 def scale_value(value, scaling):
     """Scale a value.
 
@@ -43,15 +50,8 @@ def scale_value(value, scaling):
     valid `shadho.scaling` function and cannot be called), a warning is issued
     and the value is returned without modification.
     """
-    SCALES = {
-        'linear': linear,
-        'ln': ln,
-        'log_10': log_10,
-        'log_2': log_2
-    }
     try:
-        scaled = SCALES[scaling](value) if scaling in SCALES \
-                 else scaling(value)
+        scaled = _SCALES.get(scaling, scaling)(value)
     except TypeError:
         msg = "Invalid scaling {}. {} will not be altered.".format(scaling,
                                                                    value)
@@ -61,6 +61,30 @@ def scale_value(value, scaling):
     return scaled
 
 
+def scale_many(values, scaling):
+    """Scale a sequence of values at once.
+
+    Parameters
+    ----------
+    values : array_like
+        The values to scale.
+    scaling : {'linear', 'ln', 'log_10', 'log_2'} or callable
+        The name of the `shadho.scaling` function to use or a function/callable
+        object to apply to the array of values.
+
+    Returns
+    -------
+    scaled : `numpy.ndarray`
+        The scaled values.
+
+    Notes
+    -----
+    The values are converted to a `numpy.ndarray` so that the scaling is
+    applied with one vectorized operation rather than once per value.
+    """
+    return scale_value(np.asarray(values), scaling)
+
+
 def linear(x, coeff=1.0, degree=1.0):
     """Scale a value linearly.
 
@@ -87,12 +111,20 @@ def linear(x, coeff=1.0, degree=1.0):
     return a string, etc.
     """
     try:
-        if not isinstance(x, np.ndarray):
+        if isinstance(x, np.ndarray):
+            if degree == 1:
+                # Scale directly into an array of the input type.
+                out = np.empty_like(x)
+                np.multiply(x, coeff, out=out, casting='unsafe')
+                x = out
+            else:
+                # Scale the power in place to avoid another temporary.
+                out = np.power(x, degree)
+                np.multiply(out, coeff, out=out, casting='unsafe')
+                x = out.astype(x.dtype, copy=False)
+        else:
             t = type(x)
             x = t(coeff * np.power(x, degree))
-        else:
-            dtype = x.dtype
-            x = (coeff * np.power(x, degree)).astype(dtype)
     except TypeError:
         x = x
 
@@ -122,8 +154,16 @@ def ln(x):
     the input type. All return values are converted to floating point
     as a consequence of using base *e*.
     """
+    # Fast path for Python scalars.
+    if type(x) is int or type(x) is float:
+        try:
+            return math.exp(x)
+        except OverflowError:
+            return math.inf
+
     try:
-        if not isinstance(x, numbers.Number):
+        if not isinstance(x, _NUMERIC_OR_ARRAY) \
+                and not isinstance(x, numbers.Number):
             raise TypeError
         x = np.exp(x)
     except TypeError:
@@ -157,15 +197,25 @@ def log_10(x):
     The exception to this rule is when an `x` less than 0 is supplied. In this
     case the return value will always be floating-point.
     """
+    # Fast paths for Python scalars. Non-negative ints are raised exactly.
+    t = type(x)
+    if t is int and 0 <= x <= 308:
+        return 10 ** x
+    elif t is float or t is int and x < 0:
+        try:
+            return math.pow(10.0, x)
+        except OverflowError:
+            return math.inf
+
     try:
-        if isinstance(x, numbers.Number):
+        if isinstance(x, np.ndarray):
+            dtype = x.dtype
+            x = np.power(10.0, x).astype(dtype)
+        elif isinstance(x, _NUMERIC) or isinstance(x, numbers.Number):
             t = type(x)
             x = np.power(10.0, x)
             if t(x) == x:
                 x = t(x)
-        elif isinstance(x, np.ndarray):
-            dtype = x.dtype
-            x = np.power(10.0, x).astype(dtype)
         else:
             raise TypeError('{} is not a numeric type, cannot take log'.format(x))
     except TypeError:
@@ -199,18 +249,38 @@ def log_2(x):
     The exception to this rule is when an `x` less than 0 is supplied. In this
     case the return value will always be floating-point.
     """
+    # Fast paths for Python scalars. Integer powers of 2 are computed exactly.
+    t = type(x)
+    if t is int and 0 <= x < 1024:
+        return 1 << x
+    elif t is int and x < 0:
+        return math.ldexp(1.0, x)
+    elif t is float:
+        try:
+            return math.ldexp(1.0, int(x)) if x.is_integer() else 2.0 ** x
+        except OverflowError:
+            return math.inf
+
     try:
-        if isinstance(x, numbers.Number):
+        if isinstance(x, np.ndarray):
+            x = np.exp2(x).astype(x.dtype)
+        elif isinstance(x, _NUMERIC) or isinstance(x, numbers.Number):
             t = type(x)
             x = np.exp2(x)
             if t(x) == x:
                 x = t(x)
-        elif isinstance(x, np.ndarray):
-            dtype = x.dtype
-            x = np.exp2(x).astype(x.dtype)
         else:
             raise TypeError('{}  is not a numeric type, cannot take log'.format(x))
     except TypeError:
         x = x
 
     return x
+
+
+# Scaling functions addressable by name in `scale_value`.
+_SCALES = {
+    'linear': linear,
+    'ln': ln,
+    'log_10': log_10,
+    'log_2': log_2
+}
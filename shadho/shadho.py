@@ -96,7 +96,12 @@ class Shadho(pyrameter.FMin):
             and hyperparameters_per_task > 0 \
             else 1
 
+        self.manager = None
+        self.deadline = float('inf')
         self.ccs = OrderedDict()
+        self._assignment_key = None
+        self._tags = {}
+        self._results_since_save = 0
 
         self.files = []
         if files is not None:
@@ -104,7 +109,11 @@ class Shadho(pyrameter.FMin):
                 self.files.append(f)
         self.assignments = {}
 
-        self.__tmpdir = tempfile.mkdtemp(prefix='shadho_', suffix='_output')
+        # The output directory and everything written to it are removed when
+        # this instance is garbage collected or the interpreter exits.
+        self.__tmpdir_handle = tempfile.TemporaryDirectory(prefix='shadho_',
+                                                           suffix='_output')
+        self.__tmpdir = self.__tmpdir_handle.name
 
         self.add_input_file(
             os.path.join(os.path.dirname(__file__), 'worker.py'),
@@ -118,10 +127,6 @@ class Shadho(pyrameter.FMin):
         self.add_input_file(os.path.join(self.__tmpdir, '.shadhorc'))
         # self.backend = backend
 
-    def __del__(self):
-        if hasattr(self, '__tmpdir') and self.__tmpdir is not None:
-            os.rmdir(self.__tmpdir)
-
     def add_input_file(self, localpath, remotepath=None, cache=True):
         """Add an input file to the global file list.
 
@@ -205,7 +210,7 @@ class Shadho(pyrameter.FMin):
         returned.
         """
         # Set up the task manager as defined in `shadho.managers`
-        if not hasattr(self, 'manager'):
+        if self.manager is None:
             self.manager = create_manager(
                 manager_type=self.config.manager,
                 config=self.config,
@@ -232,6 +237,7 @@ class Shadho(pyrameter.FMin):
         self.assign_to_ccs()
 
         self.start = time.time()
+        self.deadline = time.monotonic() + self.timeout
         completed_tasks = 0
         try:
             # Run the search until timeout or until all tasks complete
@@ -240,9 +246,8 @@ class Shadho(pyrameter.FMin):
                 if self.manager.hungry(pending_tasks=self.ready_trials, leeway=len(self.ccs)):
                     for x in range(2 * self.manager.num_workers() - self.ready_trials):
                         self.generate()
-                # Run another task and await results
-                result = self.manager.run_task()
-                if result is not None:
+                # Run tasks and collect every result that is ready
+                for result in self.manager.run_batch(self.max_queued_tasks):
                     # If a task returned post-process as a success or fail
                     if len(result) == 3:
                         self.success(*result)  # Store and move on
@@ -250,7 +255,8 @@ class Shadho(pyrameter.FMin):
                     else:
                         self.failure(*result)  # Resubmit if asked
                 # Checkpoint the results to file or DB at some frequency
-                if self.trial_count % self.save_frequency == 0:
+                if self._results_since_save >= self.save_frequency:
+                    self._results_since_save = 0
                     self.save()
 
             self.save()
@@ -258,8 +264,8 @@ class Shadho(pyrameter.FMin):
             # If requested, continue the loop until all tasks return
             if self.await_pending:
                 while not self.manager.empty():
-                    result = self.manager.run_task()
-                    if result is not None:
+                    for result in self.manager.run_batch(
+                            self.max_queued_tasks):
                         if len(result) == 3:
                             self.success(*result)
                         else:
@@ -268,11 +274,14 @@ class Shadho(pyrameter.FMin):
 
         # On keyboard interrupt, save any results and clean up
         except KeyboardInterrupt:
-            if hasattr(self, '__tmpdir') and self.__tmpdir is not None:
-                os.rmdir(self.__tmpdir)
+            self.__tmpdir_handle.cleanup()
 
         self.end = time.time()
 
+        # Shut down the manager's worker processes or threads before the
+        # interpreter exits
+        self.manager.close()
+
         # Save the results and print the optimal set of parameters to screen
         self.save()
         self.summary()
@@ -292,10 +301,10 @@ class Shadho(pyrameter.FMin):
             True if either the timeout or trial limit has been reached,
             False otherwise.
         """
-        elapsed = time.time() - self.start
-        exhausted = all([space.done(self.max_tasks) 
-                         for space in self.searchspaces])
-        return elapsed >= self.timeout or exhausted
+        if time.monotonic() >= self.deadline:
+            return True
+        return all([space.done(self.max_tasks)
+                    for space in self.searchspaces])
 
     def generate(self):
         """Generate hyperparameter values to test.
@@ -324,9 +333,8 @@ class Shadho(pyrameter.FMin):
             if isinstance(trial, Trial):
                 self.trials[trial.id] = trial
                 # Encode info to map to db in the task tag
-                tag = '.'.join([str(trial.id),
-                                str(trial.searchspace.id),
-                                cc_id])
+                tag = f'{trial.id}.{trial.searchspace.id}.{cc_id}'
+                self._tags[tag] = (trial.id, trial.searchspace.id, cc_id)
                 self.manager.add_task(
                     self.cmd,
                     tag,
@@ -336,18 +344,18 @@ class Shadho(pyrameter.FMin):
                     value=cc.value)
                 cc.current_tasks += 1
             elif isinstance(trial, list) and len(trial) > 0:
+                tasks = []
                 for t in trial:
                     self.trials[t.id] = t
-                    tag = '.'.join([str(t.id),
-                                    str(t.searchspace.id),
-                                    cc_id])
-                    self.manager.add_task(
-                        self.cmd,
-                        tag,
-                        t.parameter_dict,
-                        files=self.files,
-                        resource=cc.resource,
-                        value=cc.value)
+                    tag = f'{t.id}.{t.searchspace.id}.{cc_id}'
+                    self._tags[tag] = (t.id, t.searchspace.id, cc_id)
+                    tasks.append((tag, t.parameter_dict))
+                self.manager.add_tasks(
+                    self.cmd,
+                    tasks,
+                    files=self.files,
+                    resource=cc.resource,
+                    value=cc.value)
                 cc.current_tasks += len(trial)
 
     def assign_to_ccs(self):
@@ -373,59 +381,54 @@ class Shadho(pyrameter.FMin):
         # classes exist, heuristically assign search trees to CCs. If no
         # compute classes exist, create a dummy to wrap the search.
         if len(self.ccs) > 1:
+            # There is nothing to assign until the search has spaces.
+            if len(self.searchspaces) == 0:
+                return
+
             # Sort models in the search by complexity, priority, or both and
             # get the updated order.
             # self.backend.sort_spaces(use_complexity=self.use_complexity,
             self.sort_spaces(use_complexity=self.use_complexity,
                              use_uncertainty=self.use_uncertainty)
 
+            # Keep the current assignments if neither the compute classes nor
+            # the search space order changed since they were made.
+            key = (tuple(self.ccs), tuple(ss.id for ss in self.searchspaces))
+            if key == self._assignment_key:
+                return
+            self._assignment_key = key
+
             # Clear the current assignments
-            for cc in self.ccs:
+            for cc in self.ccs.values():
                 cc.clear()
 
-            # Determine if the number of compute classes or the number of
-            # model ids is larger
-            ccids = list(self.ccs.keys())
-            larger = self.searchspaces \
-                     if len(self.searchspaces) >= len(ccids) \
-                     else ccids
-            smaller = ccids if larger == len(self.searchspaces) \
-                      else self.searchspaces
-
-            # Assign models to CCs such that each model is assigned to at
-            # least two CCs.
-
-            # Steps between `smaller` index increment
-            x = float(len(larger)) / float(len(smaller))
-            y = x - 1  # Current step index (offset by 1 for 0-indexing)
-            j = 0  # Current index of `smaller`
-            m = len(smaller) / 2  # Halfway point for second assignment
-            n = len(larger) / 2  # Halfway point for second assignment
-
-            for i in range(len(larger)):
-                # If at a step point for `smaller` increment the index
-                if i > np.ceil(y):
-                    j += 1
-                    y += x
-
-                # Add the model to the current CC. If i <= n, add the model to
-                # the next CC as well; if i > n, add to the previous CC.
-                if smaller[j] in self.ccs:
-                    self.ccs[smaller[j]].add_searchspace(larger[i])
-                    if j < m:
-                        self.ccs[smaller[j + 1]].add_searchspace(
-                            self.searchspaces[larger[i]])
-                    else:
-                        self.ccs[smaller[j - 1]].add_searchspace(
-                            self.searchspaces[larger[i]])
-                else:
-                    self.ccs[larger[i]].add_searchspace(smaller[j])
-                    if i < n:
-                        self.ccs[larger[i + 1]].add_searchspace(
-                            self.searchspaces[smaller[j]])
-                    else:
-                        self.ccs[larger[i - 1]].add_searchspace(
-                            self.searchspaces[smaller[j]])
+            # Split the larger of the compute class and search space lists
+            # into one balanced, contiguous chunk per entry of the smaller
+            # list. Every search space is assigned to at least two compute
+            # classes: chunks are mirrored to a neighboring compute class
+            # (the next one in the first half, the previous one in the second
+            # half), and a compute class that is alone in its chunk shares
+            # its search space with its neighbor.
+            ccs = list(self.ccs.values())
+            spaces = self.searchspaces
+            if len(spaces) >= len(ccs):
+                m = (len(ccs) + 1) // 2
+                chunks = np.array_split(np.arange(len(spaces)), len(ccs))
+                for j, chunk in enumerate(chunks):
+                    assigned = [spaces[i] for i in chunk.tolist()]
+                    ccs[j].add_searchspace(assigned)
+                    ccs[j + 1 if j < m else j - 1].add_searchspace(assigned)
+            else:
+                n = (len(ccs) + 1) // 2
+                chunks = np.array_split(np.arange(len(ccs)), len(spaces))
+                for j, chunk in enumerate(chunks):
+                    chunk = chunk.tolist()
+                    for i in chunk:
+                        ccs[i].add_searchspace(spaces[j])
+                    if len(chunk) == 1:
+                        i = chunk[0]
+                        ccs[i + 1 if i < n else i - 1].add_searchspace(
+                            spaces[j])
         elif len(self.ccs) == 0:
             cc = ComputeClass('all', None, None, min(self.max_tasks, self.max_queued_tasks))
             self.ccs[cc.id] = cc
@@ -454,8 +457,8 @@ class Shadho(pyrameter.FMin):
         event that storing the result caused the model's priority to be
         updated.
         """
-        # Get bookkeeping information from the task tag
-        trial_id, ss_id, ccid = tag.split('.')
+        # Get bookkeeping information recorded for the task tag
+        trial_id, ss_id, ccid = self._tags.pop(tag)
 
         if not isinstance(results, list):
             results['compute_class'] = {
@@ -464,7 +467,7 @@ class Shadho(pyrameter.FMin):
                 'value': self.ccs[ccid].value
             }
         else:
-            trial_id = trial_id.split('@')
+            trial_id = str(trial_id).split('@')
             ccdata = {
                 'id': ccid,
                 'name': self.ccs[ccid].name,
@@ -477,6 +480,7 @@ class Shadho(pyrameter.FMin):
         # Update the DB with the result
         # self.backend.register_result(ss_id, trial_id, loss, results)
         self.register_result(ss_id, trial_id, loss, results)
+        self._results_since_save += 1
 
         # Reassign models to CCs at some frequency
         # n_completed = sum([1 for trial in self.backend.trials.values()
@@ -501,16 +505,16 @@ class Shadho(pyrameter.FMin):
         This method will resubmit failed tasks on request to account for
         potential worker dropout, etc.
         """
-        # Get bookkeeping information from the task tag
-        trial_id, ss_id, ccid = tag.split('.')
-
-        trials = trial_id.split('@')
+        # Get bookkeeping information recorded for the task tag
+        ids = self._tags.pop(tag)
+        trial_id, ss_id, ccid = ids
 
         # Determine whether or not to resubmit
         # self.backend.register_result(ss_id, trial_id, objective=None,
         submissions, params = \
             self.register_result(ss_id, trial_id, objective=None,
                                  results=None, errmsg='yes')
+        self._results_since_save += 1
 
         # Resubmit the task if it should be, otherwise update the number of
         # enqueued items.
@@ -522,5 +526,6 @@ class Shadho(pyrameter.FMin):
                                   files=self.files,
                                   resource=cc.resource,
                                   value=cc.value)
+            self._tags[tag] = ids
         else:
             self.ccs[ccid].current_tasks -= 1
@@ -1,5 +1,14 @@
 """Hyperparameter search space domain definitions.
 
+Classes
+-------
+UniformDomain
+    Continuous uniform domain sampled directly from the RNG.
+NormalDomain
+    Continuous normal domain sampled directly from the RNG.
+ChoiceDomain
+    Discrete domain sampled directly from the RNG.
+
 Functions
 ---------
 scope
@@ -68,6 +77,169 @@ def scope(exclusive=False, optional=False, **kwargs):
     return Specification(**kwargs)
 
 
+# Upper quantile of the central 99.9% interval of the standard normal,
+# i.e. ``scipy.stats.norm.ppf(0.9995)``.
+NORM_999_HALF_WIDTH = 3.2905267314919255
+
+
+class _DirectDomain(ContinuousDomain):
+    """Continuous domain that samples from a numpy RNG without `scipy.stats`.
+
+    Parameters
+    ----------
+    rng : `numpy.random.Generator` or `numpy.random.RandomState`, optional
+        RNG to draw values from. If omitted, the `numpy.random.RandomState`
+        shared by the search (set by pyrameter) is used, which keeps seeded
+        searches reproducible.
+    seed : int, optional
+        If passed without ``rng``, create a dedicated PCG64
+        `numpy.random.Generator` for this domain with
+        ``numpy.random.default_rng(seed)``.
+
+    Notes
+    -----
+    All other arguments are passed to `pyrameter.ContinuousDomain`.
+    """
+
+    def __init__(self, *args, rng=None, seed=None, **kwargs):
+        super(_DirectDomain, self).__init__(*args, **kwargs)
+        if rng is None and seed is not None:
+            rng = np.random.default_rng(seed)
+        self.rng = rng
+
+        # The distribution is frozen, so its complexity never changes.
+        self._complexity = 2 + np.abs(self.interval_width())
+
+    @property
+    def complexity(self):
+        return self._complexity
+
+    @property
+    def generator(self):
+        """The RNG that values are drawn from.
+
+        Returns
+        -------
+        rng : `numpy.random.Generator` or `numpy.random.RandomState`
+            ``rng`` if one was passed or created from ``seed``, otherwise the
+            search's shared `numpy.random.RandomState`. Both provide the
+            ``uniform`` and ``normal`` methods used by subclasses.
+        """
+        return self.rng if self.rng is not None else self._rng.rng
+
+    def interval_width(self):
+        """Width of the central 99.9% interval of the distribution."""
+        a, b = self.bounds
+        return b - a
+
+
+class UniformDomain(_DirectDomain):
+    """Continuous uniform domain sampled directly from the RNG.
+
+    Behaves like a `pyrameter.ContinuousDomain` over `scipy.stats.uniform`,
+    but draws values with ``uniform`` on the RNG instead of going through
+    the generic ``rvs`` machinery of `scipy.stats` on every sample. As in
+    `scipy.stats.uniform`, ``scale`` is the width of the interval.
+    """
+
+    def interval_width(self):
+        """Width of the central 99.9% interval of the distribution."""
+        # The 99.9% interval of a uniform distribution is 0.999 * scale wide,
+        # so skip the two ``ppf`` calls made by ``interval``.
+        return 0.999 * self.domain_kwargs.get('scale', 1)
+
+    def generate(self, size=None):
+        """Generate hyperparameter values from this domain.
+
+        Parameters
+        ----------
+        size : int, optional
+            If passed, draw this many values at once and return them as an
+            array. By default, draw a single value.
+        """
+        loc = self.domain_kwargs.get('loc', 0)
+        scale = self.domain_kwargs.get('scale', 1)
+        return self.callback(self.generator.uniform(loc, loc + scale, size))
+
+
+class NormalDomain(_DirectDomain):
+    """Continuous normal domain sampled directly from the RNG.
+
+    Behaves like a `pyrameter.ContinuousDomain` over `scipy.stats.norm`, but
+    draws values with ``normal`` on the RNG instead of going through the
+    generic ``rvs`` machinery of `scipy.stats` on every sample.
+    """
+
+    def interval_width(self):
+        """Width of the central 99.9% interval of the distribution."""
+        # The 99.9% interval of a normal distribution spans
+        # +/- NORM_999_HALF_WIDTH standard deviations around the mean.
+        return 2 * NORM_999_HALF_WIDTH * self.domain_kwargs.get('scale', 1)
+
+    def generate(self, size=None):
+        """Generate hyperparameter values from this domain.
+
+        Parameters
+        ----------
+        size : int, optional
+            If passed, draw this many values at once and return them as an
+            array. By default, draw a single value.
+        """
+        loc = self.domain_kwargs.get('loc', 0)
+        scale = self.domain_kwargs.get('scale', 1)
+        return self.callback(self.generator.normal(loc, scale, size))
+
+
+class ChoiceDomain(DiscreteDomain):
+    """Discrete domain that draws indices directly from the RNG.
+
+    Behaves like a `pyrameter.DiscreteDomain`, but draws the index of the
+    next value from the search's shared `numpy.random.RandomState` (with
+    ``randint``) instead of creating a `scipy.stats.randint` distribution on
+    every sample. If the search RNG is a `numpy.random.Generator`, its
+    ``integers`` method is used instead.
+    """
+
+    def generate(self, size=None):
+        """Generate the index of a value in this domain.
+
+        Parameters
+        ----------
+        size : int, optional
+            If passed, draw this many indices at once and return them as an
+            array. By default, draw a single index.
+        """
+        n = len(self.domain)
+        if n == 0:
+            return None
+        rng = self._rng.rng
+        if isinstance(rng, np.random.Generator):
+            return rng.integers(n, size=size)
+        return rng.randint(n, size=size)
+
+
+def _uniform(lo, hi, callback, **kwargs):
+    """Create a uniform domain over [``lo``, ``hi``] scaled by ``callback``."""
+    return UniformDomain(scipy.stats.uniform, loc=lo, scale=np.abs(hi - lo),
+                         callback=callback, **kwargs)
+
+
+def _normal(mu, sigma, callback, **kwargs):
+    """Create a normal domain with mean ``mu`` scaled by ``callback``."""
+    return NormalDomain(scipy.stats.norm, loc=mu, scale=sigma,
+                        callback=callback, **kwargs)
+
+
+def _randint(lo, hi, step, callback=None):
+    """Create a discrete domain over [``lo``, ``hi``) scaled by ``callback``."""
+    if step > 0 and lo > hi:
+        lo, hi = hi, lo
+    values = range(lo, hi, step)
+    if callback is None:
+        return ChoiceDomain(list(values))
+    return ChoiceDomain([callback(i) for i in values])
+
+
 # Uniform distribution
 def uniform(lo, hi, **kwargs):
     """Continuous uniform distribution.
@@ -83,10 +255,9 @@ def uniform(lo, hi, **kwargs):
 
     Returns
     -------
-    domain : `pyrameter.ContinuousDomain`
+    domain : `shadho.spaces.UniformDomain`
     """
-    return ContinuousDomain(scipy.stats.uniform, loc=lo, scale=np.abs(hi - lo),
-                            callback=linear, **kwargs)
+    return _uniform(lo, hi, linear, **kwargs)
 
 
 def ln_uniform(lo, hi, **kwargs):
@@ -104,10 +275,9 @@ def ln_uniform(lo, hi, **kwargs):
 
     Returns
     -------
-    domain : `pyrameter.ContinuousDomain`
+    domain : `shadho.spaces.UniformDomain`
     """
-    return ContinuousDomain(scipy.stats.uniform, loc=lo, scale=np.abs(hi - lo), callback=ln,
-                            **kwargs)
+    return _uniform(lo, hi, ln, **kwargs)
 
 
 def log10_uniform(lo, hi, **kwargs):
@@ -125,10 +295,9 @@ def log10_uniform(lo, hi, **kwargs):
 
     Returns
     -------
-    domain : `pyrameter.ContinuousDomain`
+    domain : `shadho.spaces.UniformDomain`
     """
-    return ContinuousDomain(scipy.stats.uniform, loc=lo, scale=np.abs(hi - lo),
-                            callback=log_10, **kwargs)
+    return _uniform(lo, hi, log_10, **kwargs)
 
 
 def log2_uniform(lo, hi, **kwargs):
@@ -146,10 +315,9 @@ def log2_uniform(lo, hi, **kwargs):
 
     Returns
     -------
-    domain : `pyrameter.ContinuousDomain`
+    domain : `shadho.spaces.UniformDomain`
     """
-    return ContinuousDomain(scipy.stats.uniform, loc=lo, scale=np.abs(hi - lo),
-                            callback=log_2, **kwargs)
+    return _uniform(lo, hi, log_2, **kwargs)
 
 
 # Normal distribution
@@ -168,10 +336,9 @@ def normal(mu, sigma, **kwargs):
 
     Returns
     -------
-    domain : `pyrameter.ContinuousDomain`
+    domain : `shadho.spaces.NormalDomain`
     """
-    return ContinuousDomain(scipy.stats.norm, loc=lo, scale=hi,
-                            callback=linear, **kwargs)
+    return _normal(mu, sigma, linear, **kwargs)
 
 
 def ln_normal(mu, sigma, **kwargs):
@@ -190,10 +357,9 @@ def ln_normal(mu, sigma, **kwargs):
 
     Returns
     -------
-    domain : `pyrameter.ContinuousDomain`
+    domain : `shadho.spaces.NormalDomain`
     """
-    return ContinuousDomain(scipy.stats.norm, loc=lo, scale=hi, callback=ln,
-                            **kwargs)
+    return _normal(mu, sigma, ln, **kwargs)
 
 
 def log10_normal(mu, sigma, **kwargs):
@@ -212,10 +378,9 @@ def log10_normal(mu, sigma, **kwargs):
 
     Returns
     -------
-    domain : `pyrameter.ContinuousDomain`
+    domain : `shadho.spaces.NormalDomain`
     """
-    return ContinuousDomain(scipy.stats.norm, loc=lo, scale=hi,
-                            callback=log_10, **kwargs)
+    return _normal(mu, sigma, log_10, **kwargs)
 
 
 def log2_normal(mu, sigma, **kwargs):
@@ -234,10 +399,9 @@ def log2_normal(mu, sigma, **kwargs):
 
     Returns
     -------
-    domain : `pyrameter.ContinuousDomain`
+    domain : `shadho.spaces.NormalDomain`
     """
-    return ContinuousDomain(scipy.stats.norm, loc=lo, scale=hi,
-                            callback=log_2, **kwargs)
+    return _normal(mu, sigma, log_2, **kwargs)
 
 
 # Randint distributions
@@ -245,7 +409,9 @@ def randint(lo, hi, step=1):
     """Uniform distribution over a sequence of integers.
 
     The distribution is over the integer sequence [``lo``, ``hi``) with step
-    ``step`` spacing.
+    ``step`` spacing. If ``step`` is positive and ``lo`` is greater than
+    ``hi``, the bounds are swapped; a negative ``step`` counts down from
+    ``lo`` to ``hi``.
 
     Parameters
     ----------
@@ -258,9 +424,9 @@ def randint(lo, hi, step=1):
 
     Returns
     -------
-    domain : `pyrameter.DiscreteDomain`
+    domain : `shadho.spaces.ChoiceDomain`
     """
-    return DiscreteDomain(list(range(lo, hi, step)))
+    return _randint(lo, hi, step)
 
 
 def ln_randint(lo, hi, step=1):
@@ -281,9 +447,9 @@ def ln_randint(lo, hi, step=1):
 
     Returns
     -------
-    domain : `pyrameter.DiscreteDomain`
+    domain : `shadho.spaces.ChoiceDomain`
     """
-    return DiscreteDomain([ln(i) for i in range(lo, hi, step)])
+    return _randint(lo, hi, step, ln)
 
 
 def log10_randint(lo, hi, step=1):
@@ -304,9 +470,9 @@ def log10_randint(lo, hi, step=1):
 
     Returns
     -------
-    domain : `pyrameter.DiscreteDomain`
+    domain : `shadho.spaces.ChoiceDomain`
     """
-    return DiscreteDomain([log_10(i) for i in range(lo, hi, step)])
+    return _randint(lo, hi, step, log_10)
 
 
 def log2_randint(lo, hi, step=1):
@@ -327,9 +493,9 @@ def log2_randint(lo, hi, step=1):
 
     Returns
     -------
-    domain : `pyrameter.DiscreteDomain`
+    domain : `shadho.spaces.ChoiceDomain`
     """
-    return DiscreteDomain([log_2(i) for i in range(lo, hi, step)])
+    return _randint(lo, hi, step, log_2)
 
 
 # Choice
@@ -347,9 +513,9 @@ def choice(choices):
 
     Returns
     -------
-    domain : `pyrameter.DiscreteDomain`
+    domain : `shadho.spaces.ChoiceDomain`
     """
-    return DiscreteDomain(choices)
+    return ChoiceDomain(choices)
 
 
 # Exhaustive (a.k.a. Grid Search)
@@ -1,16 +1,71 @@
 import json
+import math
 import re
 
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_numpy(obj):
+    """Convert a numpy array or scalar to a JSON-compatible dict."""
+    if isinstance(obj, float):
+        # numpy.float64 subclasses float, so the standard library encoder
+        # writes it as a plain number. Do the same here for orjson.
+        return float(obj)
+    elif isinstance(obj, (np.ndarray, np.generic)):
+        return {
+            '__data': obj.tolist(),
+            '__dtype': str(obj.dtype),
+        }
+    raise TypeError(
+        'Object of type {} is not JSON serializable'.format(
+            type(obj).__name__))
+
+
+def _decode_numpy(obj):
+    """Convert a dict created by `_encode_numpy` back to a numpy value."""
+    if isinstance(obj, dict) and sorted(obj.keys()) == ['__data', '__dtype']:
+        if isinstance(obj['__data'], list):
+            arr = np.array(obj['__data']).astype(obj['__dtype'])
+        else:
+            arr = np.dtype(obj['__dtype']).type(obj['__data'])
+        return arr
+    else:
+        return obj
+
+
+def _has_non_finite(obj):
+    """Determine whether a serializable object contains NaN or Infinity."""
+    if isinstance(obj, (float, np.floating)):
+        return not math.isfinite(obj)
+    elif isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    elif isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    elif isinstance(obj, np.ndarray) and obj.dtype.kind in 'fc':
+        return not np.isfinite(obj).all()
+    else:
+        return False
+
+
+def _decode_nested(obj):
+    """Apply `_decode_numpy` to every object in a parsed JSON document."""
+    if isinstance(obj, dict):
+        return _decode_numpy({k: _decode_nested(v) for k, v in obj.items()})
+    elif isinstance(obj, list):
+        return [_decode_nested(v) for v in obj]
+    else:
+        return obj
+
 
 class ShadhoEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, (np.ndarray, np.generic)):
-            return {
-                '__data': obj.tolist(),
-                '__dtype': str(obj.dtype),
-            }
+            return _encode_numpy(obj)
         else:
             return super(ShadhoEncoder, self).default(obj)
 
@@ -21,11 +76,71 @@ class ShadhoDecoder(json.JSONDecoder):
             *args, object_hook=self.object_hook, **kwargs)
 
     def object_hook(self, obj):
-        if isinstance(obj, dict) and sorted(obj.keys()) == ['__data', '__dtype']:
-            if isinstance(obj['__data'], list):
-                arr = np.array(obj['__data']).astype(obj['__dtype'])
-            else:
-                arr = np.dtype(obj['__dtype']).type(obj['__data'])
-            return arr
+        return _decode_numpy(obj)
+
+
+# Reusable encoder and decoder for the standard library fallbacks.
+_ENCODER = ShadhoEncoder(separators=(',', ':'))
+_DECODER = ShadhoDecoder()
+
+
+def dumps(obj):
+    """Serialize an object to a compact JSON string.
+
+    Uses orjson if it is installed, otherwise the standard library encoder.
+    Numpy values are encoded as by `ShadhoEncoder`.
+
+    Parameters
+    ----------
+    obj
+        The object to serialize.
+
+    Returns
+    -------
+    s : str
+        The ASCII JSON representation of ``obj``.
+    """
+    if orjson is not None:
+        try:
+            s = orjson.dumps(obj, default=_encode_numpy,
+                             option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
         else:
-            return obj
+            # orjson does not escape non-ASCII characters. Keep the output
+            # ASCII, as the standard library does, so that its length in
+            # characters matches its length in bytes. orjson also writes NaN
+            # and +/-Infinity as null, so re-encode objects containing them
+            # with the standard library, which preserves them.
+            if s.isascii() and (b'null' not in s
+                                or not _has_non_finite(obj)):
+                return s.decode('ascii')
+    return _ENCODER.encode(obj)
+
+
+def loads(s):
+    """Deserialize a JSON document.
+
+    Uses orjson if it is installed, otherwise the standard library decoder.
+    Numpy values are decoded as by `ShadhoDecoder`.
+
+    Parameters
+    ----------
+    s : str or bytes
+        The JSON document to deserialize.
+
+    Returns
+    -------
+    obj
+        The deserialized object.
+    """
+    if orjson is not None:
+        try:
+            return _decode_nested(orjson.loads(s))
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN and Infinity, which the standard library
+            # writes for non-finite floats.
+            pass
+    if isinstance(s, bytes):
+        s = s.decode('utf-8')
+    return _DECODER.decode(s)
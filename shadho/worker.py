@@ -110,7 +110,7 @@ def run(task, cfgpath='.shadhorc'):
     # Load hyperparameters to test
     spec = {}
     if os.path.isfile(cfg['global']['param_file']):
-        with open(cfg['global']['param_file'], 'r') as f:
+        with open(cfg['global']['param_file'], 'r', encoding='utf-8') as f:
             spec = json.load(f, cls=ShadhoDecoder)
 
     # Run the task and save the results in a format `shahdo` recognizes.
@@ -126,7 +126,11 @@ def run(task, cfgpath='.shadhorc'):
     with open(cfg['global']['result_file'], 'w') as f:
         json.dump(result, f, cls=ShadhoEncoder)
 
-    # Compress into the expected output file.
+    # Compress into the expected output file, unless the results file is
+    # returned as-is.
+    if cfg['global']['output'] == cfg['global']['result_file']:
+        return
+
     ext = os.path.splitext(cfg['global']['output'])
     mode = ':'.join(['w', ext]) if ext in ['gz', 'bz2'] else 'w'
     with tarfile.open(cfg['global']['output'], mode) as f:
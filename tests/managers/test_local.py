@@ -0,0 +1,128 @@
+import pytest
+
+from shadho.managers.local import LocalManager, LocalTask, TaskFailureError
+
+
+def square(params):
+    return float(params['x'] ** 2)
+
+
+def fail(params):
+    raise RuntimeError('failed')
+
+
+class TestLocalManager(object):
+    def test_init(self):
+        m = LocalManager('loss')
+        assert m.opt_value == 'loss'
+        assert m.empty()
+        assert m.tasks_submitted == 0
+
+    def test_add_task(self):
+        m = LocalManager('loss')
+        m.add_task(square, 'foo', {'x': 2})
+        assert not m.empty()
+        assert m.tasks_submitted == 1
+
+    def test_add_tasks(self):
+        m = LocalManager('loss')
+        m.add_tasks(square, [('a', {'x': 1}), ('b', {'x': 2})])
+        assert m.tasks_submitted == 2
+        assert [t.tag for t in m.tasks] == ['a', 'b']
+
+    def test_run_task(self):
+        m = LocalManager('loss')
+
+        # Test with an empty queue
+        assert m.run_task() is None
+
+        # Test float, dict, and list results
+        m.add_task(square, 'a', {'x': 2})
+        assert m.run_task() == ('a', 4.0, {'loss': 4.0})
+
+        m.add_task(lambda p: {'loss': 1.0, 'acc': 0.5}, 'b', {})
+        assert m.run_task() == ('b', 1.0, {'loss': 1.0, 'acc': 0.5})
+
+        m.add_task(lambda p: [1.0, {'loss': 2.0}], 'c', {})
+        assert m.run_task() == ('c', [1.0, 2.0],
+                                [{'loss': 1.0}, {'loss': 2.0}])
+
+        # Test a failing task and an invalid result
+        m.add_task(fail, 'd', {})
+        assert m.run_task() == ('d', False)
+        m.add_task(lambda p: 'foo', 'e', {})
+        assert m.run_task() == ('e', False)
+        assert m.empty()
+
+    def test_run_batch(self):
+        m = LocalManager('loss')
+        for i in range(5):
+            m.add_task(square, str(i), {'x': i})
+        m.add_task(fail, 'fail', {})
+
+        # Serial batches run one task at a time.
+        for i in range(5):
+            assert m.run_batch(3) == [(str(i), float(i ** 2),
+                                       {'loss': float(i ** 2)})]
+
+        assert m.run_batch(10) == [('fail', False)]
+        assert m.run_batch(10) == []
+        assert m.empty()
+
+    def test_run_all_serial(self):
+        m = LocalManager('loss')
+        for i in range(3):
+            m.add_task(square, str(i), {'x': i})
+        m.add_task(fail, 'fail', {})
+
+        results = m.run_all()
+        assert [r[0] for r in results] == ['0', '1', '2', 'fail']
+        assert results[-1] == ('fail', False)
+        assert m.empty()
+
+    def test_run_all(self):
+        m = LocalManager('loss', processes=2)
+        for i in range(8):
+            m.add_task(square, str(i), {'x': i})
+        m.add_task(fail, 'fail', {})
+
+        results = m.run_all()
+        assert ('fail', False) in results
+        results = sorted((r for r in results if len(r) == 3),
+                         key=lambda r: int(r[0]))
+        assert results == [(str(i), float(i ** 2), {'loss': float(i ** 2)})
+                           for i in range(8)]
+        assert m.empty()
+        m.close()
+
+    def test_run_batch_processes(self):
+        m = LocalManager('loss', processes=2)
+        assert m.num_workers() == 2
+        for i in range(6):
+            m.add_task(square, str(i), {'x': i})
+
+        results = m.run_batch(4)
+        assert sorted(r[0] for r in results) == ['0', '1', '2', '3']
+        assert [t.tag for t in m.tasks] == ['4', '5']
+        m.close()
+
+    def test_run_all_unpicklable(self):
+        # Tasks that cannot be sent to the pool stay on the task list.
+        m = LocalManager('loss', processes=2)
+        for i in range(3):
+            m.add_task(lambda p: 1.0, str(i), {})
+        with pytest.raises(Exception):
+            m.run_all()
+        assert len(m.tasks) == 3
+        m.close()
+
+
+class TestLocalTask(object):
+    def test_run(self):
+        t = LocalTask(square, 'foo', {'x': 3})
+        assert t.tag == 'foo'
+        assert t.run() == 9.0
+
+        t = LocalTask(fail, 'foo', {})
+        with pytest.raises(TaskFailureError):
+            t.run()
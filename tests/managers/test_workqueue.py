@@ -1,10 +1,12 @@
 import pytest
 
-from shadho.managers.workqueue import WQManager, WQFile, WQBuffer
+from shadho.managers.workqueue import WQManager, WQFile, WQBuffer, \
+                                     _read_file, _read_tar_member
 
 import gc
 import os
 import shutil
+import tarfile
 import tempfile
 
 import work_queue
@@ -45,7 +47,6 @@ class TestWQManager(object):
 
         #del wq
 
-        os.remove('shadho_wq.log')
         os.remove('shadho_wq.debug')
         os.remove('dummy.log')
         os.remove('dummy.debug')
@@ -66,10 +67,51 @@ class TestWQManager(object):
         wq.add_task('echo hello', 'totally_unique_tag', {})
         assert wq.tasks_submitted == 1
 
-        os.remove('shadho_wq.log')
         os.remove('shadho_wq.debug')
         shutil.rmtree(tmpdir)
 
+
+def test_read_file():
+    tmpdir = tempfile.mkdtemp()
+    path = os.path.join(tmpdir, 'performance.json')
+    for contents in [b'', b'{"loss": 1.0}', b'0' * (3 << 20)]:
+        with open(path, 'wb') as f:
+            f.write(contents)
+        assert _read_file(path) == contents
+    shutil.rmtree(tmpdir)
+
+
+def test_read_tar_member():
+    tmpdir = tempfile.mkdtemp()
+    results = os.path.join(tmpdir, 'performance.json')
+    with open(results, 'w') as f:
+        f.write('{"loss": 1.0}')
+    other = os.path.join(tmpdir, 'other')
+    with open(other, 'w') as f:
+        f.write('foo')
+
+    # Test single-member archives in each format, compressed or not
+    out = os.path.join(tmpdir, 'out.tar.gz')
+    for mode in ['w', 'w:gz']:
+        for fmt in [tarfile.USTAR_FORMAT, tarfile.GNU_FORMAT,
+                    tarfile.PAX_FORMAT]:
+            with tarfile.open(out, mode, format=fmt) as tar:
+                tar.add(results, arcname='performance.json')
+            assert _read_tar_member(out, 'performance.json') == \
+                b'{"loss": 1.0}'
+
+    # Test an archive where the results file is not the first member
+    with tarfile.open(out, 'w') as tar:
+        tar.add(other, arcname='other')
+        tar.add(results, arcname='performance.json')
+    assert _read_tar_member(out, 'performance.json') == b'{"loss": 1.0}'
+
+    with pytest.raises(KeyError):
+        _read_tar_member(out, 'missing.json')
+
+    shutil.rmtree(tmpdir)
+
+
 class TestWQFile(object):
     def test_init(self):
         open('foo.bar', 'a').close()
@@ -110,8 +152,10 @@ class TestWQFile(object):
 
         # Test using a file that does not exist
         # Should work for output files, but not for input files
+        WQFile._exists_cache.clear()
         with pytest.raises(IOError):
             WQFile('foo.bar')
+        WQFile('foo.bar', check_exists=False)
 
         f = WQFile('foo.bar', remotepath='baz', ftype='output', cache=False)
         assert f.localpath == 'foo.bar'
@@ -132,6 +176,9 @@ class TestWQBuffer(object):
         assert f.remotepath == 'bar.baz'
         assert f.cache == WQFile.CACHE[False]
 
+        f = WQBuffer(b'foo', 'bar.baz')
+        assert f.buffer == 'foo'
+
         f = WQBuffer(12, 392847, cache=True)
         assert f.buffer == '12'
         assert f.remotepath == '392847'
@@ -1,6 +1,6 @@
 import pytest
 
-from shadho.scaling import scale_value, linear, ln, log_10, log_2
+from shadho.scaling import scale_value, scale_many, linear, ln, log_10, log_2
 
 import numpy as np
 
@@ -216,3 +216,55 @@ def test_log_2():
 
     x = log_2(None)
     assert x is None
+
+
+def test_scale_many():
+    vals = np.arange(-3, 4)
+
+    x = scale_many(vals, 'linear')
+    assert np.array_equal(x, vals)
+    assert x.dtype == vals.dtype
+
+    x = scale_many(vals, 'ln')
+    assert np.array_equal(x, np.exp(vals))
+
+    x = scale_many(vals.astype(np.float64), 'log_10')
+    assert np.array_equal(x, np.power(10.0, vals))
+
+    x = scale_many(vals.astype(np.float64), 'log_2')
+    assert np.array_equal(x, np.exp2(vals))
+
+    x = scale_many([1, 2, 3], lambda y: y * 2)
+    assert np.array_equal(x, [2, 4, 6])
+
+
+def test_scalar_fast_paths():
+    # Integer powers are exact and keep the integer type
+    assert log_2(10) == 1024 and isinstance(log_2(10), int)
+    assert log_10(20) == 10 ** 20 and isinstance(log_10(20), int)
+
+    # Negative integer powers and floats are floating point
+    assert log_2(-2) == 0.25
+    assert log_10(-1) == 0.1
+    assert log_2(3.0) == 8.0 and isinstance(log_2(3.0), float)
+    assert np.isclose(log_2(0.5), np.exp2(0.5))
+    assert np.isclose(log_10(0.5), np.power(10.0, 0.5))
+    assert np.isclose(ln(0.5), np.exp(0.5))
+
+    # Overflow saturates to infinity, as with numpy
+    assert ln(1000.0) == np.inf
+    assert log_10(400.0) == np.inf
+    assert log_2(2000.0) == np.inf
+
+
+def test_linear_array():
+    vals = np.arange(-5, 5)
+    for coeff, degree in [(1.0, 1.0), (2.5, 1.0), (0.5, 2.0), (3.0, 3)]:
+        x = linear(vals, coeff=coeff, degree=degree)
+        v = (coeff * np.power(vals, degree)).astype(vals.dtype)
+        assert x.dtype == vals.dtype
+        assert np.array_equal(x, v)
+
+        x = linear(vals.astype(np.float32), coeff=coeff, degree=degree)
+        assert x.dtype == np.float32
+        assert np.allclose(x, coeff * np.power(vals, degree))
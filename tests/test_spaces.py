@@ -0,0 +1,109 @@
+import pytest
+
+from shadho import spaces
+from shadho.scaling import linear, ln, log_10, log_2
+
+import numpy as np
+from pyrameter.domains import ContinuousDomain
+from pyrameter.reproducibility import GlobalRNG
+import scipy.stats
+
+
+def test_uniform():
+    for f, callback in [(spaces.uniform, linear), (spaces.ln_uniform, ln),
+                        (spaces.log10_uniform, log_10),
+                        (spaces.log2_uniform, log_2)]:
+        d = f(2, 5)
+        assert isinstance(d, spaces.UniformDomain)
+        assert d.domain_kwargs['loc'] == 2
+        assert d.domain_kwargs['scale'] == 3
+        assert d.callback is callback
+
+    # Sampling matches the scipy.stats path for the same seed.
+    d = spaces.uniform(2, 5)
+    d.set_rng(GlobalRNG(1))
+    rng = GlobalRNG(1)
+    for _ in range(10):
+        v = scipy.stats.uniform.rvs(loc=2, scale=3, random_state=rng.rng)
+        assert np.isclose(d.generate(), v)
+
+    # Complexity matches the pyrameter definition.
+    ref = ContinuousDomain(scipy.stats.uniform, loc=2, scale=3)
+    assert np.isclose(d.complexity, ref.complexity)
+
+
+def test_normal():
+    for f, callback in [(spaces.normal, linear), (spaces.ln_normal, ln),
+                        (spaces.log10_normal, log_10),
+                        (spaces.log2_normal, log_2)]:
+        d = f(1, 2.5)
+        assert isinstance(d, spaces.NormalDomain)
+        assert d.domain_kwargs['loc'] == 1
+        assert d.domain_kwargs['scale'] == 2.5
+        assert d.callback is callback
+
+    d = spaces.normal(1, 2.5)
+    d.set_rng(GlobalRNG(1))
+    rng = GlobalRNG(1)
+    for _ in range(10):
+        v = scipy.stats.norm.rvs(loc=1, scale=2.5, random_state=rng.rng)
+        assert np.isclose(d.generate(), v)
+
+    ref = ContinuousDomain(scipy.stats.norm, loc=1, scale=2.5)
+    assert np.isclose(d.complexity, ref.complexity)
+
+
+def test_seed():
+    d = spaces.uniform(0, 1, seed=3)
+    rng = np.random.default_rng(3)
+    for _ in range(10):
+        assert d.generate() == rng.uniform(0, 1)
+
+
+def test_randint():
+    assert spaces.randint(0, 5).domain == [0, 1, 2, 3, 4]
+    assert spaces.randint(0, 10, step=3).domain == [0, 3, 6, 9]
+    assert spaces.randint(5, 0).domain == [0, 1, 2, 3, 4]
+    assert spaces.randint(10, 0, -2).domain == [10, 8, 6, 4, 2]
+    assert all(isinstance(i, int) for i in spaces.randint(0, 5).domain)
+
+    assert spaces.log2_randint(0, 4).domain == [1, 2, 4, 8]
+    assert spaces.log10_randint(0, 3).domain == [1, 10, 100]
+    assert np.allclose(spaces.ln_randint(0, 3).domain, np.exp([0, 1, 2]))
+
+    # Domains built from the same bounds do not share state.
+    a = spaces.randint(0, 5)
+    b = spaces.randint(0, 5)
+    assert a.domain is not b.domain
+
+
+def test_choice():
+    d = spaces.choice(['a', 'b', 'c', 'd'])
+    assert isinstance(d, spaces.ChoiceDomain)
+    assert d.domain == ['a', 'b', 'c', 'd']
+
+    d.set_rng(GlobalRNG(4))
+    rng = GlobalRNG(4)
+    for _ in range(10):
+        assert d.generate() == scipy.stats.randint.rvs(0, 4,
+                                                       random_state=rng.rng)
+
+    # A numpy Generator set as the search RNG is drawn from with integers.
+    d.set_rng(GlobalRNG(4))
+    d._rng.rng = np.random.default_rng(4)
+    gen = np.random.default_rng(4)
+    for _ in range(10):
+        assert d.generate() == gen.integers(4)
+
+
+def test_generate_size():
+    # Batched draws match the same number of single draws.
+    for d in [spaces.uniform(2, 5), spaces.log10_uniform(-2, 2),
+              spaces.normal(1, 2.5), spaces.randint(0, 10)]:
+        d.set_rng(GlobalRNG(2))
+        batch = d.generate(size=8)
+        d.set_rng(GlobalRNG(2))
+        single = [d.generate() for _ in range(8)]
+        assert isinstance(batch, np.ndarray)
+        assert batch.shape == (8,)
+        assert np.allclose(batch, single)
@@ -0,0 +1,37 @@
+import math
+
+from shadho.utils import dumps, loads, _ENCODER
+
+import numpy as np
+
+
+def test_dumps_loads():
+    obj = {'a': 1, 'b': [1.5, 'c'], 'd': None, 'e': np.float32(2.5),
+           'f': np.arange(3)}
+    out = loads(dumps(obj))
+    assert out['a'] == 1
+    assert out['b'] == [1.5, 'c']
+    assert out['d'] is None
+    assert out['e'] == np.float32(2.5)
+    assert np.array_equal(out['f'], np.arange(3))
+
+
+def test_non_finite():
+    s = dumps({'x': float('inf'), 'y': -float('inf'), 'z': float('nan'),
+               'w': np.float64('inf')})
+    assert 'null' not in s
+    out = loads(s)
+    assert out['x'] == float('inf')
+    assert out['y'] == -float('inf')
+    assert math.isnan(out['z'])
+    assert out['w'] == float('inf')
+
+
+def test_orjson_matches_stdlib():
+    values = [None, np.float64(1.5), np.float32(2.5), np.int64(3),
+              np.bool_(True), {'a': None, 'b': np.float64(-0.5)}]
+    for value in values:
+        fast = loads(dumps(value))
+        slow = loads(_ENCODER.encode(value))
+        assert type(fast) is type(slow)
+        assert fast == slow